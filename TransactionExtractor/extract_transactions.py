@@ -29,241 +29,257 @@ Output:
 -----------------------------------------------------------
 """
 
+import mmap
+import os
 import re
 import sys
-from typing import List, Tuple, Optional
+from bisect import bisect_right
+from typing import Iterable, List, Tuple, Optional, Union
+
+
+# ✅ Robust regex pattern (compiled once at import — avoids re-compiling
+# and the `re` internal cache lookup on every call).
+# Captures: transaction type (uppercase only), amount integer part,
+# optional amount fraction, alphanumeric ID. Splitting the amount into
+# int/fraction groups lets the loop build the float with integer math
+# instead of float()'s general string parser. Kept as a bytes pattern so
+# matching stays on the ASCII fast path instead of Unicode character-class
+# dispatch.
+_TXN_PATTERN = rb"TXN:\s*([A-Z]+)\s*\|\s*AMT:\s*([\d,]+)(?:\.(\d+))?\s*\|\s*ID:\s*([A-Za-z0-9]+)"
+
+def _engine_ok(candidate) -> bool:
+    """Sanity-check a candidate regex engine before adopting it: it must
+    match a valid entry and must stay case-sensitive (uppercase labels
+    only — a caseless engine would break the module's contract)."""
+    try:
+        return (
+            candidate.search(b"TXN:A | AMT:1 | ID:x") is not None
+            and candidate.search(b"txn:a | amt:1 | id:x") is None
+        )
+    except Exception:
+        return False
+
+
+# Engine selection, fastest first, all sharing the finditer surface the
+# extractor uses:
+#   1. PCRE2 with JIT (python-pcre) — JIT-compiled native matching code.
+#   2. RE2 (google-re2) — linear-time DFA, no pathological backtracking.
+#   3. Stdlib re — always available.
+# Any import/compile failure or a candidate that fails the sanity check
+# falls through to the next engine instead of breaking module import.
+_TXN_RE = None
+try:
+    import pcre as _pcre
+
+    # python-pcre studies patterns with JIT by default; no study flag is
+    # passed at compile time (PCRE_STUDY_JIT_COMPILE is a study option —
+    # as a compile flag its value collides with PCRE_CASELESS).
+    _candidate = _pcre.compile(_TXN_PATTERN)
+    if _engine_ok(_candidate):
+        _TXN_RE = _candidate
+except Exception:
+    pass
+
+if _TXN_RE is None:
+    try:
+        import re2 as _re2
+
+        _candidate = _re2.compile(_TXN_PATTERN)
+        if _engine_ok(_candidate):
+            _TXN_RE = _candidate
+    except Exception:
+        pass
+
+if _TXN_RE is None:
+    _TXN_RE = re.compile(_TXN_PATTERN)
+
+# Separator used by extract_transactions_many; the NUL byte cannot occur
+# inside a match, so entries never straddle two logs.
+_LOG_SEPARATOR = b"\n\x00\n"
+
+# Optional Hyperscan prefilter: a SIMD block-mode scan finds candidate
+# entry starts ("TXN:<TYPE>") at memory-bandwidth speed, and the full
+# capture regex then runs only at those positions instead of over every
+# byte of the input.
+try:
+    import hyperscan as _hyperscan
+
+    _HS_DB = _hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[rb"TXN:\s*[A-Z]+"],
+        ids=[0],
+        flags=[_hyperscan.HS_FLAG_SOM_LEFTMOST],
+    )
+except Exception:
+    # Missing bindings or a failed database compile — use the full-scan path.
+    _HS_DB = None
+
+
+def _prefilter_starts(data: bytes) -> List[int]:
+    """Return sorted candidate match-start offsets found by Hyperscan."""
+    starts = set()
+
+    def _on_match(_id, start, _end, _flags, _context=None):
+        starts.add(start)
+
+    _HS_DB.scan(data, match_event_handler=_on_match)
+    return sorted(starts)
 
 
 # --------------------------
 # Core Extraction Function
 # --------------------------
-def extract_transactions(log_text: str) -> List[Tuple[str, float, str]]:
+def extract_transactions(log_text: Union[str, bytes]) -> List[Tuple[str, float, str]]:
     """
     Extracts transaction details matching:
       TXN:<TYPE> | AMT:<AMOUNT> | ID:<ALPHANUMERIC>
 
     Args:
-        log_text (str): Raw multiline string containing log entries.
+        log_text (Union[str, bytes]): Raw multiline log entries; any
+                                      bytes-like buffer (bytes, mmap,
+                                      memoryview) is scanned in place.
 
     Returns:
         List[Tuple[str, float, str]]: A list of (txn_type, amount, txn_id)
                                       or [] if none found.
 
     Raises:
-        TypeError: If the input is not a string.
+        TypeError: If the input is not a string or bytes-like buffer.
     """
 
-    if not isinstance(log_text, str):
-        raise TypeError("Input must be a string containing transaction logs.")
-
-    # ✅ Robust regex pattern
-    pattern = re.compile(
-        r"""
-        TXN:\s*([A-Z]+)\s*              # Capture transaction type (uppercase only)
-        \|\s*AMT:\s*([\d,]+(?:\.\d+)?)  # Capture amount (commas + decimals)
-        \s*\|\s*ID:\s*([A-Za-z0-9]+)    # Capture alphanumeric ID
-        """,
-        re.VERBOSE,
-    )
+    if isinstance(log_text, str):
+        # Encode once so the regex runs over bytes (valid entries are ASCII).
+        log_bytes = log_text.encode("ascii", "ignore")
+    elif isinstance(log_text, (bytes, bytearray, memoryview, mmap.mmap)):
+        log_bytes = log_text
+    else:
+        raise TypeError("Input must be a string or bytes-like buffer containing transaction logs.")
 
-    matches = pattern.findall(log_text)
     results: List[Tuple[str, float, str]] = []
 
-    for txn_type, amount_str, txn_id in matches:
-        # Normalize numeric string → float
+    # Stream matches instead of materializing findall's full tuple list,
+    # and localize hot names to skip LOAD_GLOBAL inside the loop.
+    _int = int
+    _float = float
+    _append = results.append
+
+    if _HS_DB is not None:
+        # Prefiltered path: anchor the capture regex at each candidate
+        # start instead of scanning the whole buffer with it.
+        _match = _TXN_RE.match
+        last_end = 0
+        for start in _prefilter_starts(log_bytes):
+            if start < last_end:
+                # Candidate falls inside the previous entry's span.
+                continue
+            m = _match(log_bytes, start)
+            if m is None:
+                continue
+            last_end = m.end()
+            try:
+                intpart = _int(m.group(2).translate(None, b","))
+            except ValueError:
+                # Skip malformed entries gracefully
+                continue
+            frac = m.group(3)
+            try:
+                if frac:
+                    scale = 10 ** len(frac)
+                    normalized_amount = (intpart * scale + _int(frac)) / scale
+                else:
+                    normalized_amount = _float(intpart)
+            except OverflowError:
+                digits = m.group(2).translate(None, b",")
+                normalized_amount = _float(digits + b"." + frac if frac else digits)
+            _append((m.group(1).decode("ascii"), normalized_amount, m.group(4).decode("ascii")))
+        return results
+
+    for m in _TXN_RE.finditer(log_bytes):
+        # Normalize numeric string → float via integer math on the captures
         try:
-            normalized_amount = float(amount_str.replace(",", ""))
+            intpart = _int(m.group(2).translate(None, b","))
         except ValueError:
             # Skip malformed entries gracefully
             continue
 
-        results.append((txn_type, normalized_amount, txn_id))
+        frac = m.group(3)
+        try:
+            if frac:
+                # Single correctly-rounded division; adding a separately-rounded
+                # fraction to the integer part would round twice.
+                scale = 10 ** len(frac)
+                normalized_amount = (intpart * scale + _int(frac)) / scale
+            else:
+                normalized_amount = _float(intpart)
+        except OverflowError:
+            # Amount beyond float range — the float() string parse
+            # saturates to inf instead of raising.
+            digits = m.group(2).translate(None, b",")
+            normalized_amount = _float(digits + b"." + frac if frac else digits)
+        _append((m.group(1).decode("ascii"), normalized_amount, m.group(4).decode("ascii")))
 
     return results
 
 
-# --------------------------
-# Optional CLI Interface
-# --------------------------
-def _read_file(file_path: str) -> Optional[str]:
-    """Utility to read log text from a file safely."""
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
-        print(f"❌ File not found: {file_path}")
-    except Exception as e:
-        print(f"⚠️ Error reading file: {e}")
-    return None
-
-
-def main():
-    """
-    Command-line interface:
-        python extract_transactions.py log.txt
-    or
-        python extract_transactions.py
-        (then paste log text manually)
+def extract_transactions_many(logs: Iterable[str]) -> List[List[Tuple[str, float, str]]]:
     """
+    Batch variant of extract_transactions for many logs at once.
 
-    print("💳 Transaction Value Extractor (Regex Parser)")
-    print("============================================")
-
-    # If a file path is provided
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]
-        log_data = _read_file(file_path)
-        if log_data is None:
-            sys.exit(1)
-    else:
-        print("Paste or type transaction logs below (Ctrl+D to end):\n")
-        log_data = sys.stdin.read()
-
-    extracted = extract_transactions(log_data)
-    if not extracted:
-        print("\n⚠️  No valid transaction entries found.")
-    else:
-        print("\n✅ Extracted Transactions:")
-        for i, (txn_type, amt, txn_id) in enumerate(extracted, 1):
-            print(f"{i:02d}. {txn_type:7s} | {amt:10.2f} | ID: {txn_id}")
-
-    print("\nDone ✔")
-
-
-# --------------------------
-# Unit Tests (Quick Check)
-# --------------------------
-def _run_internal_tests():
-    """Basic verification tests for the regex logic."""
-
-    tests = [
-        # ✅ Basic log
-        (
-            '''
-            TXN:CREDIT | AMT:1,250.50 | ID:AB123
-            TXN:DEBIT  | AMT:500 | ID:XY789
-            ''',
-            [("CREDIT", 1250.50, "AB123"), ("DEBIT", 500.0, "XY789")],
-        ),
-
-        # ✅ Messy spacing
-        (
-            'TXN: DEBIT|AMT:1000|ID:XYZ42 TXN:CREDIT | AMT:200.75 | ID:LMN55',
-            [("DEBIT", 1000.0, "XYZ42"), ("CREDIT", 200.75, "LMN55")],
-        ),
-
-        # ✅ No matches
-        ('TXN CREDIT AMT 123 ID 999', []),
-
-        # ✅ Mixed case (ignored)
-        ('Txn:Credit | Amt:50 | Id:abc999', []),
-
-        # ✅ Multiple mixed entries
-        (
-            '''
-            TXN:CREDIT | AMT:10,000.00 | ID:TXN001
-            INVALID LINE
-            TXN:DEBIT | AMT:5,500.25 | ID:ABC987
-            TXN:CREDIT | AMT:250 | ID:XYZ111
-            ''',
-            [("CREDIT", 10000.0, "TXN001"), ("DEBIT", 5500.25, "ABC987"), ("CREDIT", 250.0, "XYZ111")],
-        ),
-    ]
-
-    for i, (log, expected) in enumerate(tests, start=1):
-        result = extract_transactions(log)
-        assert result == expected, f"❌ Test {i} failed: {result} != {expected}"
-    print("✅ All internal regex tests passed!")
-
-
-# --------------------------
-# Script Entry Point
-# --------------------------
-if __name__ == "__main__":
-    if len(sys.argv) > 1 and sys.argv[1] == "--test":
-        _run_internal_tests()
-    else:
-        main()
-"""
-===========================================================
-Task 1 – Transaction Value Extractor (Regex Capture Challenge)
-===========================================================
-
-Author : Barath R
-Email  : barathasm3002@gmail.com
-Date   : 2025-11-09
------------------------------------------------------------
-Description:
--------------
-Parses multiline transaction logs containing entries like:
-    TXN:<TYPE> | AMT:<AMOUNT> | ID:<ALPHANUMERIC>
-
-Extracts all valid matches using regular expressions only and returns:
-    [(txn_type, amount, txn_id), ...]
-
-Strictly enforces uppercase labels (TXN, AMT, ID) and numeric format.
-Handles commas, decimals, and whitespace variations.
-
-Example:
----------
-Input:
-    TXN:CREDIT | AMT:1,250.50 | ID:AB123
-    TXN:DEBIT  | AMT:500 | ID:XY789
-
-Output:
-    [('CREDIT', 1250.50, 'AB123'), ('DEBIT', 500.0, 'XY789')]
------------------------------------------------------------
-"""
-
-import re
-import sys
-from typing import List, Tuple, Optional
-
-
-# --------------------------
-# Core Extraction Function
-# --------------------------
-def extract_transactions(log_text: str) -> List[Tuple[str, float, str]]:
-    """
-    Extracts transaction details matching:
-      TXN:<TYPE> | AMT:<AMOUNT> | ID:<ALPHANUMERIC>
+    Joins all inputs into one buffer and runs a single regex pass over it,
+    amortizing per-call overhead across the whole batch. Matches are
+    assigned back to their source log by bisecting the match offset into
+    the per-log start offsets.
 
     Args:
-        log_text (str): Raw multiline string containing log entries.
+        logs (Iterable[str]): Raw log texts, one per source file.
 
     Returns:
-        List[Tuple[str, float, str]]: A list of (txn_type, amount, txn_id)
-                                      or [] if none found.
+        List[List[Tuple[str, float, str]]]: One result list per input log,
+                                            in input order.
 
     Raises:
-        TypeError: If the input is not a string.
+        TypeError: If any input is not a string.
     """
 
-    if not isinstance(log_text, str):
-        raise TypeError("Input must be a string containing transaction logs.")
-
-    # ✅ Robust regex pattern
-    pattern = re.compile(
-        r"""
-        TXN:\s*([A-Z]+)\s*              # Capture transaction type (uppercase only)
-        \|\s*AMT:\s*([\d,]+(?:\.\d+)?)  # Capture amount (commas + decimals)
-        \s*\|\s*ID:\s*([A-Za-z0-9]+)    # Capture alphanumeric ID
-        """,
-        re.VERBOSE,
-    )
-
-    matches = pattern.findall(log_text)
-    results: List[Tuple[str, float, str]] = []
-
-    for txn_type, amount_str, txn_id in matches:
-        # Normalize numeric string → float
+    chunks: List[bytes] = []
+    offsets: List[int] = []  # start offset of each log in the joined buffer
+    pos = 0
+    for log in logs:
+        if not isinstance(log, str):
+            raise TypeError("Each log must be a string containing transaction logs.")
+        encoded = log.encode("ascii", "ignore")
+        offsets.append(pos)
+        chunks.append(encoded)
+        pos += len(encoded) + len(_LOG_SEPARATOR)
+
+    joined = _LOG_SEPARATOR.join(chunks)
+    results: List[List[Tuple[str, float, str]]] = [[] for _ in chunks]
+
+    _int = int
+    _float = float
+    _bisect = bisect_right
+    for m in _TXN_RE.finditer(joined):
         try:
-            normalized_amount = float(amount_str.replace(",", ""))
+            intpart = _int(m.group(2).translate(None, b","))
         except ValueError:
-            # Skip malformed entries gracefully
             continue
 
-        results.append((txn_type, normalized_amount, txn_id))
+        frac = m.group(3)
+        try:
+            if frac:
+                # Single correctly-rounded division; adding a separately-rounded
+                # fraction to the integer part would round twice.
+                scale = 10 ** len(frac)
+                normalized_amount = (intpart * scale + _int(frac)) / scale
+            else:
+                normalized_amount = _float(intpart)
+        except OverflowError:
+            # Amount beyond float range — the float() string parse
+            # saturates to inf instead of raising.
+            digits = m.group(2).translate(None, b",")
+            normalized_amount = _float(digits + b"." + frac if frac else digits)
+        idx = _bisect(offsets, m.start()) - 1
+        results[idx].append((m.group(1).decode("ascii"), normalized_amount, m.group(4).decode("ascii")))
 
     return results
 
@@ -271,11 +287,18 @@ def extract_transactions(log_text: str) -> List[Tuple[str, float, str]]:
 # --------------------------
 # Optional CLI Interface
 # --------------------------
-def _read_file(file_path: str) -> Optional[str]:
-    """Utility to read log text from a file safely."""
+def _read_file(file_path: str) -> Optional[Union[bytes, mmap.mmap]]:
+    """Utility to open log text from a file safely.
+
+    Returns a read-only mmap so the regex engine scans the OS page cache
+    directly instead of copying the whole file into a Python string.
+    """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            # The mapping stays valid after the descriptor is closed.
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     except FileNotFoundError:
         print(f"❌ File not found: {file_path}")
     except Exception as e:
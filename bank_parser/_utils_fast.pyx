@@ -0,0 +1,82 @@
+# cython: language_level=3
+# bank_parser/_utils_fast.pyx
+#
+# Optional compiled fast paths for the per-transaction helpers in
+# bank_parser/utils.py. Build with:
+#     cythonize -i bank_parser/_utils_fast.pyx
+# utils.py falls back to the pure-Python implementations when this
+# extension is not built.
+
+
+def normalize_amount_fast(unicode s):
+    """Single-pass parser for plain amounts: an optional leading sign,
+    ASCII digits, one decimal point, with currency symbols, commas and
+    spaces skipped. Returns None when the string is anything else —
+    including rarities float() understands (exponents, underscores,
+    inf/nan) — and the caller falls back to the general parser, so both
+    builds always agree.
+
+    Integer and fraction digits are accumulated as exact Python ints and
+    combined with one correctly-rounded division, so accepted values are
+    bit-identical to float() at any magnitude."""
+    cdef bint seen_digit = False
+    cdef bint in_frac = False
+    cdef bint neg = False
+    cdef bint signed = False
+    cdef int frac_len = 0
+    cdef Py_UCS4 ch
+    intpart = 0  # Python ints: exact beyond 2**53, unlike a double
+    frac = 0
+
+    for ch in s:
+        if u'0' <= ch <= u'9':
+            if in_frac:
+                frac = frac * 10 + <int> (ch - 48)
+                frac_len += 1
+            else:
+                intpart = intpart * 10 + <int> (ch - 48)
+            seen_digit = True
+        elif ch == u'.':
+            if in_frac:
+                return None
+            in_frac = True
+        elif (ch == u'-' or ch == u'+') and not signed and not seen_digit and not in_frac:
+            signed = True
+            neg = ch == u'-'
+        elif ch == u',' or ch == u'₹' or ch == u'$' or ch == u'€' \
+                or ch == u' ' or ch == u'\t':
+            continue
+        else:
+            return None
+
+    if not seen_digit:
+        return None
+    try:
+        if frac_len:
+            # One exact integer ratio, one correctly-rounded division — adding
+            # a separately-rounded fraction would round twice.
+            scale = 10 ** frac_len
+            val = (intpart * scale + frac) / scale
+        else:
+            val = float(intpart)
+    except OverflowError:
+        # Beyond float range — defer to the general parser, which
+        # saturates to inf instead of raising.
+        return None
+    return -val if neg else val
+
+
+def mask_account_number_fast(unicode s):
+    """Single-pass digit collector for account masking."""
+    cdef Py_UCS4 ch
+    cdef unicode digits = u''
+    cdef int count = 0
+
+    for ch in s:
+        if u'0' <= ch <= u'9':
+            digits += ch
+            count += 1
+
+    if count >= 4:
+        return u'****' + digits[-4:]
+    return u'****'
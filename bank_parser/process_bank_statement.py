@@ -2,6 +2,11 @@
 import json, argparse, os
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from bank_parser.utils import (
     read_file_text,
     gemini_extract_json_from_file,
@@ -94,5 +99,8 @@ if __name__ == "__main__":
 
     data = process_bank_statement(args.file_path, test_mode=args.test)
     with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+        else:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     print(f"💾 Wrote: {os.path.abspath(args.out)}")